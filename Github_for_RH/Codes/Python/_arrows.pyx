@@ -0,0 +1,47 @@
+"""
+Compiled arrow geometry for draw_networkx_edges in networkx_pylab_new.
+
+Build the extension next to networkx_pylab_new.py with
+
+	CFLAGS="-O3 -ffast-math -march=native" cythonize -i _arrows.pyx
+
+so that the loop below is auto-vectorized.  networkx_pylab_new uses
+numba or plain numpy instead when the extension is not built.
+"""
+cimport cython
+from cython cimport floating
+from libc.math cimport sqrt
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+@cython.cdivision(True)
+def build_arrows(floating[:, :] src, floating[:, :] dst,
+				 floating[:] X, floating[:] Y, floating[:] stem,
+				 double p, floating[:, :, :] out):
+	"""Fill out[e] with the arrow polygon of the edge src[e]->dst[e].
+
+	X, Y and stem are the arrow outline from _arrow_template(p) and
+	out is an (E,K,2) array, K being the number of outline vertices.
+	All arrays share one dtype, float32 or float64; the arithmetic is
+	done in double precision either way.
+	"""
+	cdef Py_ssize_t e, k
+	cdef Py_ssize_t E=src.shape[0], K=X.shape[0]
+	cdef double dx, dy, invL, length, invl, cx, sx, tx, ty, x
+	with nogil:
+		for e in range(E):
+			dx=dst[e,0]-src[e,0]
+			dy=dst[e,1]-src[e,1]
+			invL=1.0/sqrt(dx*dx+dy*dy)
+			dx=dx-p*dx*invL # stop the tip short of the target node
+			dy=dy-p*dy*invL
+			length=sqrt(dx*dx+dy*dy)
+			invl=1.0/length
+			cx=dx*invl
+			sx=dy*invl
+			tx=src[e,0]+dx
+			ty=src[e,1]+dy
+			for k in range(K):
+				x=X[k]-length*stem[k]
+				out[e,k,0]=x*cx-Y[k]*sx+tx
+				out[e,k,1]=x*sx+Y[k]*cx+ty
@@ -14,6 +14,8 @@ Provides:
  - draw_spring
  - draw_shell
  - draw_graphviz
+ - clear_layout_cache()
+ - update_positions()
 
 References:
  - matplotlib:     http://matplotlib.sourceforge.net/
@@ -32,18 +34,219 @@ __revision__ = "$Id"
 #    http://www.gnu.org/copyleft/lesser.html
 
 import networkx
+import weakref
+from collections import namedtuple
+from itertools import chain
 
 try:
 	import matplotlib.cbook as cb
 	from matplotlib.colors import colorConverter
 	from matplotlib.collections import LineCollection, PolyCollection
-	from matplotlib.patches import Arrow
+	from matplotlib.patches import Arrow, FancyArrow
+	from matplotlib.font_manager import FontProperties
+	from matplotlib.pylab import gca, hold, draw_if_interactive
 	import numpy
-	from numpy import asarray, amax, amin, sqrt
+	from numpy import asarray, sqrt
 except ImportError:
 	raise ImportError, "Import Error: not able to import matplotlib."
 
-def draw(G, pos=None, with_labels=True, **kwds):
+try:
+	# optional, compiles the arrow geometry loop in _build_arrows
+	from numba import njit, prange
+except ImportError:
+	njit=None
+
+try:
+	# optional compiled arrow geometry, built from _arrows.pyx
+	from _arrows import build_arrows as _c_build_arrows
+except ImportError:
+	_c_build_arrows=None
+
+# dtype of the position arrays.  numpy.float32 halves the memory of the
+# endpoint gather and extent reductions (matplotlib's collections convert
+# to float64 regardless), but rounds the positions: with coordinates far
+# larger than their spread, as in lat/lon layouts, nodes visibly move.
+_POS_DTYPE=numpy.float64
+
+def _pos_array(pos, nodelist=None):
+	"""Return the positions of the nodes in nodelist as an (N,2) array.
+
+	The x-y pairs are streamed straight into the array so no
+	intermediate list of tuples is built.  Only the first two
+	coordinates of each position are used.  If nodelist is None, or
+	lists the nodes of the dict pos in its own key order, the rows
+	are read from pos.values() without looking up every node.
+	"""
+	if nodelist is None \
+		   or (isinstance(pos, dict) and isinstance(nodelist, list)
+			   and len(nodelist)==len(pos) and nodelist==list(pos)):
+		values=pos.values()
+		n=len(pos)
+	else:
+		values=(pos[v] for v in nodelist)
+		n=len(nodelist)
+	return numpy.fromiter(chain.from_iterable((xy[0], xy[1]) for xy in values),
+						  dtype=_POS_DTYPE,
+						  count=2*n).reshape(-1,2)
+
+def _node_index(nodes):
+	"""Return a dict mapping each node in nodes to its position in the list."""
+	return dict((n,i) for (i,n) in enumerate(nodes))
+
+def _pos_index(pos, nodes):
+	"""Return (node_index, pos_arr) for the node positions pos.
+
+	pos_arr is an (N,2) array of positions and node_index maps each
+	node to its row.  A dict pos gives one row per key, an array pos
+	(for integer nodes) is used as it is with node i in row i, and any
+	other sequence is looked up for the nodes in the list nodes.
+	"""
+	if isinstance(pos, dict):
+		return _node_index(list(pos)), _pos_array(pos)
+	if isinstance(pos, numpy.ndarray):
+		return _node_index(range(len(pos))), \
+			   asarray(pos[:,:2], dtype=_POS_DTYPE)
+	return _node_index(nodes), _pos_array(pos, nodes)
+
+def _positions_from_layout(G, layout_fn, **layout_kwds):
+	"""Return (nodes, pos_arr) for the layout of G computed by layout_fn.
+
+	Row i of the (N,2) array pos_arr holds the position of nodes[i].
+	A layout function that already returns such an array (ordered as
+	G.nodes()) is used directly, a dict of positions is converted once.
+	"""
+	pos=layout_fn(G, **layout_kwds)
+	if isinstance(pos, numpy.ndarray):
+		return G.nodes(), asarray(pos[:,:2], dtype=_POS_DTYPE)
+	return list(pos), _pos_array(pos)
+
+def _node_rows(node_index, nodelist):
+	"""Return the rows of pos_arr holding the nodes in nodelist."""
+	return numpy.fromiter((node_index[v] for v in nodelist),
+						  dtype=numpy.intp, count=len(nodelist))
+
+def _edge_index(node_index, edgelist):
+	"""Return the (E,2) int32 array of pos_arr rows of the edge endpoints.
+
+	pos_arr[_edge_index(node_index, edgelist)] is the (E,2,2) array
+	of edge segments.
+	"""
+	# edge e can be a 2-tuple (Graph) or a 3-tuple (Xgraph)
+	return numpy.fromiter(chain.from_iterable((node_index[e[0]],
+											   node_index[e[1]])
+											  for e in edgelist),
+						  dtype=numpy.int32,
+						  count=2*len(edgelist)).reshape(-1,2)
+
+def _arrow_template(p):
+	"""Return the outline (X, Y, stem) of an arrow with head width p.
+
+	The arrow points along the x axis with its tip at the origin.
+	For an arrow of length l the x coordinates are X-l*stem; only the
+	stem corners at the tail depend on l.  The outline is read off two
+	FancyArrows of length 1 and 2 so it matches matplotlib's geometry.
+	"""
+	a=FancyArrow(0,0,1,0,head_width=p,length_includes_head=True).get_verts()
+	b=FancyArrow(0,0,2,0,head_width=p,length_includes_head=True).get_verts()
+	a=asarray(a, dtype=float)-(1,0) # move the tips to the origin
+	b=asarray(b, dtype=float)-(2,0)
+	stem=a[:,0]-b[:,0]
+	return a[:,0]+stem, a[:,1].copy(), stem
+
+# edge arrows all share one head width, so their outline is built once
+_ARROW_HEAD_WIDTH=0.026
+_ARROW_TEMPLATE=_arrow_template(_ARROW_HEAD_WIDTH)
+
+# numba has to compile _build_arrows before its first use (once per
+# machine and dtype with cache=True), which costs more than the numpy
+# path takes for all but very large edge lists
+_NUMBA_MIN_EDGES=100000
+
+if njit is not None:
+	@njit(parallel=True, fastmath=True, error_model='numpy', cache=True)
+	def _build_arrows(src, dst, X, Y, stem, p, out):
+		"""Fill out[e] with the arrow polygon of the edge src[e]->dst[e]."""
+		for e in prange(src.shape[0]):
+			dx=dst[e,0]-src[e,0]
+			dy=dst[e,1]-src[e,1]
+			invL=1.0/sqrt(dx*dx+dy*dy)
+			dx=dx-p*dx*invL # stop the tip short of the target node
+			dy=dy-p*dy*invL
+			length=sqrt(dx*dx+dy*dy)
+			invl=1.0/length
+			cx=dx*invl
+			sx=dy*invl
+			tx=src[e,0]+dx
+			ty=src[e,1]+dy
+			for k in range(X.shape[0]):
+				x=X[k]-length*stem[k]
+				out[e,k,0]=x*cx-Y[k]*sx+tx
+				out[e,k,1]=x*sx+Y[k]*cx+ty
+else:
+	_build_arrows=None
+
+def _arrow_verts(edge_pos, p=_ARROW_HEAD_WIDTH):
+	"""Return the (E,K,2) polygon vertices of the arrows for edge_pos.
+
+	This is the vectorized equivalent of calling, for every edge,
+
+	FancyArrow(x1,y1,dx-p*vu_x,dy-p*vu_y,head_width=p,length_includes_head=True)
+
+	The outline from _arrow_template is rotated onto each edge and
+	moved to its tip.  The loop runs in the compiled _arrows extension
+	when it is built, else with numba when it is installed and there
+	are at least _NUMBA_MIN_EDGES edges, otherwise as numpy array
+	operations.
+	"""
+	if p==_ARROW_HEAD_WIDTH:
+		X, Y, stem = _ARROW_TEMPLATE
+	else:
+		X, Y, stem = _arrow_template(p)
+	# compute in the dtype of edge_pos (see _POS_DTYPE)
+	dtype=edge_pos.dtype
+	X, Y, stem = X.astype(dtype), Y.astype(dtype), stem.astype(dtype)
+	verts=numpy.empty((len(edge_pos), len(X), 2), dtype=dtype)
+	build_arrows=_c_build_arrows
+	if build_arrows is None and len(edge_pos)>=_NUMBA_MIN_EDGES:
+		build_arrows=_build_arrows
+	if build_arrows is not None:
+		build_arrows(edge_pos[:,0], edge_pos[:,1], X, Y, stem, p, verts)
+		return verts
+	src=edge_pos[:,0]
+	d=edge_pos[:,1]-src # x-y offsets
+	invL=1.0/numpy.hypot(d[:,0], d[:,1])
+	vu=d*invL[:,None] # direction in arc sense
+	d=d-p*vu # stop the tip short of the target node
+	length=numpy.hypot(d[:,0], d[:,1])
+	invl=1.0/length
+	cx=(d[:,0]*invl)[:,None]
+	sx=(d[:,1]*invl)[:,None]
+	X=X-length[:,None]*stem
+	tip=src+d
+	verts[:,:,0]=X*cx-Y*sx+tip[:,0:1]
+	verts[:,:,1]=X*sx+Y*cx+tip[:,1:2]
+	return verts
+
+# the artists drawn by draw_networkx along with the rows of pos_arr
+# they were drawn from, so update_positions can move them in place
+NetworkArtists=namedtuple('NetworkArtists',
+						  'node_collection edge_collection text_items '
+						  'node_index node_rows edge_idx')
+
+# spring layouts kept by draw(G, use_cache=True), keyed by graph
+_layout_cache=weakref.WeakKeyDictionary()
+
+def clear_layout_cache(G=None):
+	"""Forget the spring layouts cached by draw(G, use_cache=True).
+
+	If G is given only the layout of G is dropped.
+	"""
+	if G is None:
+		_layout_cache.clear()
+	else:
+		_layout_cache.pop(G, None)
+
+def draw(G, pos=None, with_labels=True, use_cache=False, **kwds):
 	"""Draw the graph G with matplotlib (pylab).
 
 	This is a pylab friendly function that will use the
@@ -62,6 +265,15 @@ def draw(G, pos=None, with_labels=True, **kwds):
 	>>> draw(G,pos)
 	>>> draw(G,pos=spring_layout(G))
 
+	When pos is None the spring layout is computed on every call.
+	With use_cache=True it is computed once per graph and reused by
+	later calls, as long as the number of nodes of G is unchanged.
+	Call clear_layout_cache(G) after other changes to G (e.g. new
+	edges) to have the layout recomputed.
+
+	>>> draw(G,use_cache=True)
+	>>> draw(G,use_cache=True) # same layout, not recomputed
+
 	Also see doc/examples/draw_*
 
 	:Parameters:
@@ -106,10 +318,18 @@ def draw(G, pos=None, with_labels=True, **kwds):
 	>>> P.draw()    # pylab draw()
 
 	"""
-	from matplotlib.pylab import gca, hold, draw_if_interactive 
-
-	if pos is None:
-		pos=networkx.drawing.spring_layout(G) # default to spring layout
+	if pos is None and kwds.get('_pos_arr') is None:
+		# default to spring layout
+		cached=None
+		if use_cache:
+			cached=_layout_cache.get(G)
+		if cached is None or cached[0]!=len(G):
+			nodes, pos_arr = _positions_from_layout(G,
+				networkx.drawing.spring_layout)
+			cached=(len(G), _node_index(nodes), pos_arr)
+			if use_cache:
+				_layout_cache[G]=cached
+		kwds['_node_idx'], kwds['_pos_arr'] = cached[1], cached[2]
 
 	ax=gca()
 	# allow callers to override the hold state by passing hold=True|False
@@ -121,13 +341,14 @@ def draw(G, pos=None, with_labels=True, **kwds):
 		# turn of axes ticks and labels
 		ax.set_xticks([])
 		ax.set_yticks([])
-		draw_networkx(G, pos, ax=ax, with_labels=with_labels, **kwds)
+		artists=draw_networkx(G, pos, ax=ax, with_labels=with_labels, **kwds)
 		draw_if_interactive()
 
 	except:
 		hold(b)
 		raise
 	hold(b)
+	return artists
 
 def draw_networkx(G, pos, with_labels=True, ax=None, **kwds):
 	"""Draw the graph G with given node positions pos
@@ -152,20 +373,76 @@ def draw_networkx(G, pos, with_labels=True, ax=None, **kwds):
 
 	with_labels contols text labeling of the nodes
 
+	Returns a NetworkArtists tuple of the node collection, the edge
+	collection, the dictionary of label text items and the indices
+	needed to move them with update_positions().
+
 	Also see:
 
 	draw_networkx_nodes()
 	draw_networkx_edges()
 	draw_networkx_labels()
 	"""
-	from matplotlib.pylab import gca, hold, draw_if_interactive 
 	if ax is None:
 		ax=gca()
+	# list the nodes and edges of G and convert pos to an array once,
+	# then share them with the helpers below;
+	# any iterable nodelist/edgelist is listed once, the index arrays need len()
+	kwds['_nodes']=list(G)
+	if kwds.get('_pos_arr') is None:
+		kwds['_node_idx'], kwds['_pos_arr'] = _pos_index(pos, kwds['_nodes'])
+	if kwds.get('nodelist') is None:
+		kwds['nodelist']=kwds['_nodes']
+	elif not isinstance(kwds['nodelist'], list):
+		kwds['nodelist']=list(kwds['nodelist'])
+	if kwds.get('edgelist') is None:
+		kwds['edgelist']=G.edges()
+	if not isinstance(kwds['edgelist'], list):
+		kwds['edgelist']=list(kwds['edgelist'])
+	kwds['_edge_idx']=_edge_index(kwds['_node_idx'], kwds['edgelist'])
+	kwds['_nodelist_rows']=_node_rows(kwds['_node_idx'], kwds['nodelist'])
 	node_collection=draw_networkx_nodes(G, pos, ax=ax, **kwds)
 	edge_collection=draw_networkx_edges(G, pos, ax=ax, **kwds) 
+	text_items={}
 	if with_labels:
-		draw_networkx_labels(G, pos, ax=ax, **kwds)
+		text_items=draw_networkx_labels(G, pos, ax=ax, **kwds)
 	draw_if_interactive()
+	return NetworkArtists(node_collection, edge_collection, text_items,
+						  kwds['_node_idx'], kwds['_nodelist_rows'],
+						  kwds['_edge_idx'])
+
+def update_positions(artists, pos_arr, edge_idx=None):
+	"""Move the artists drawn by draw_networkx to new node positions.
+
+	Usage:
+
+	>>> artists=draw_networkx(G,pos)
+	>>> for pos_arr in frames: # e.g. steps of a force-directed layout
+	...     update_positions(artists,pos_arr)
+
+	artists is the NetworkArtists tuple returned by draw_networkx
+	(or draw and the draw_* layout functions).  pos_arr is an (N,2)
+	array, of any numeric dtype, with the position of node n in row
+	artists.node_index[n].  edge_idx optionally replaces the
+	(E,2) array artists.edge_idx of the edge endpoint rows.
+
+	The existing collections and text items are updated in place, so
+	an animation frame costs no new artists.  The view limits are
+	left as they are.
+	"""
+	if edge_idx is None:
+		edge_idx=artists.edge_idx
+	pos_arr=asarray(pos_arr, dtype=_POS_DTYPE)
+	artists.node_collection.set_offsets(pos_arr[artists.node_rows])
+	if artists.edge_collection is not None:
+		edge_pos=pos_arr[edge_idx]
+		if isinstance(artists.edge_collection, LineCollection):
+			artists.edge_collection.set_segments(edge_pos)
+		else: # directed graph, edges are drawn as arrows
+			artists.edge_collection.set_verts(_arrow_verts(edge_pos))
+	node_index=artists.node_index
+	for (n,t) in artists.text_items.items():
+		t.set_position(pos_arr[node_index[n]])
 
 def draw_networkx_nodes(G, pos,
 						nodelist=None,
@@ -177,6 +454,9 @@ def draw_networkx_nodes(G, pos,
 						vmin=None,
 						vmax=None, 
 						ax=None,
+						_pos_arr=None,
+						_node_idx=None,
+						_nodelist_rows=None,
 						**kwds):
 	"""Draw nodes of graph G
 
@@ -192,15 +472,22 @@ def draw_networkx_nodes(G, pos,
 	see draw_networkx for the list of other optional parameters.
 
 	"""
-	from matplotlib.pylab import gca, hold, draw_if_interactive 
 	if ax is None:
 		ax=gca()
 
 	if nodelist is None:
 		nodelist=G.nodes()
+	if not isinstance(nodelist, list):
+		nodelist=list(nodelist) # may be any iterable, the rows need len()
 
-	x=asarray([pos[v][0] for v in nodelist])
-	y=asarray([pos[v][1] for v in nodelist])
+	if _pos_arr is None:
+		xy=_pos_array(pos, nodelist)
+	else:
+		if _nodelist_rows is None:
+			_nodelist_rows=_node_rows(_node_idx, nodelist)
+		xy=_pos_arr[_nodelist_rows]
+	x=xy[:,0]
+	y=xy[:,1]
 
 	node_collection=ax.scatter(x, y,
 							   s=node_size,
@@ -222,6 +509,9 @@ def draw_networkx_edges(G, pos,
 						style='solid',
 						alpha=1.0,
 						ax=None,
+						_pos_arr=None,
+						_node_idx=None,
+						_edge_idx=None,
 						**kwds):
 	"""Draw the edges of the graph G
 
@@ -237,28 +527,28 @@ def draw_networkx_edges(G, pos,
 	See draw_networkx for the list of other optional parameters.
 
 	"""
-	from matplotlib.pylab import gca, hold, draw_if_interactive
-	from matplotlib.patches import FancyArrow
-	from matplotlib.collections import PolyCollection
 	if ax is None:
 		ax=gca()
 
 	if edgelist is None:
 		edgelist=G.edges()
+	if not isinstance(edgelist, list):
+		edgelist=list(edgelist) # may be any iterable, the index needs len()
 
 	if not edgelist: # no edges!
 		return None
 
-	# set edge positions
-	head=[]
-	tail=[]
-	for e in edgelist:
-		# edge e can be a 2-tuple (Graph) or a 3-tuple (Xgraph)
-		u=e[0]
-		v=e[1]
-		head.append(pos[u])
-		tail.append(pos[v])
-	edge_pos=asarray(zip(head,tail))
+	# set edge positions by gathering rows of one position array
+	if _pos_arr is None:
+		nodes=None # not needed for a dict or an array pos
+		if not isinstance(pos, (dict, numpy.ndarray)):
+			# look up only the nodes the edges touch
+			nodes=list(set(chain.from_iterable((e[0], e[1])
+											   for e in edgelist)))
+		_node_idx, _pos_arr = _pos_index(pos, nodes)
+	if _edge_idx is None:
+		_edge_idx=_edge_index(_node_idx, edgelist)
+	edge_pos=_pos_arr[_edge_idx]
 
 	if not cb.iterable(width):
 		lw = (width,)
@@ -268,7 +558,12 @@ def draw_networkx_edges(G, pos,
 	# edge colors specified with floats won't work here
 	# since LineCollection doesn't use ScalarMappable.
 	# You can use an array of RGBA or text labels
-	if not cb.is_string_like(edge_color) \
+	if isinstance(edge_color, numpy.ndarray) \
+		   and edge_color.ndim==2 \
+		   and edge_color.shape[0]==len(edge_pos) \
+		   and edge_color.shape[1] in (3,4):
+		edge_colors = edge_color # RGB(A) array, used as it is
+	elif not cb.is_string_like(edge_color) \
 		   and cb.iterable(edge_color) \
 		   and len(edge_color)==len(edge_pos):
 		edge_colors = None
@@ -285,28 +580,22 @@ def draw_networkx_edges(G, pos,
 										 )
 		edge_collection.set_alpha(alpha)
 	else:
-		arrows=[]
-		for src,dst in edge_pos:
-			x1,y1=src
-			x2,y2=dst
-			dx=x2-x1 # x offset
-			dy=y2-y1 # y offset
-			vu_x=dx/sqrt(dx*dx+dy*dy)#direction in arc sense
-			vu_y=dy/sqrt(dx*dx+dy*dy)
-			p=0.026 
-			arrows.append(FancyArrow(x1,y1,dx-p*vu_x,dy-p*vu_y,head_width=p,length_includes_head=True,).get_verts())
+		arrows=_arrow_verts(edge_pos, _ARROW_HEAD_WIDTH)
 		edge_collection = PolyCollection(arrows,
 										 facecolors       = edge_colors,
 										 antialiaseds = (1,),
 										 transOffset = ax.transData,
 								 )
-	# update view        
-	xx= [x for (x,y) in head+tail]        
-	yy= [y for (x,y) in head+tail]        
-	minx = amin(xx)
-	maxx = amax(xx)
-	miny = amin(yy)
-	maxy = amax(yy)
+	# update view from the rows of pos_arr that the edges touch
+	# (marked with a mask, which unlike numpy.unique needs no sort)
+	used = numpy.zeros(len(_pos_arr), dtype=bool)
+	used[_edge_idx] = True
+	if used.all():
+		flat = _pos_arr # every node has an edge, reduce in place
+	else:
+		flat = _pos_arr[used]
+	(minx, miny) = flat.min(axis=0)
+	(maxx, maxy) = flat.max(axis=0)
 	w = maxx-minx
 	h = maxy-miny
 	padx, pady = 0.05*w, 0.05*h
@@ -328,6 +617,9 @@ def draw_networkx_labels(G, pos,
 						 font_weight='normal',
 						 alpha=1.0,
 						 ax=None,
+						 _pos_arr=None,
+						 _node_idx=None,
+						 _nodes=None,
 						 **kwds):
 	"""Draw node labels on the graph G
 
@@ -342,51 +634,80 @@ def draw_networkx_labels(G, pos,
 	See draw_networkx for the list of other optional parameters.
 
 	"""
-	from matplotlib.pylab import gca, hold, draw_if_interactive 
 	if ax is None:
 		ax=gca()
 
 	if labels is None:
-		labels=dict(zip(G.nodes(),G.nodes()))
+		if _nodes is None:
+			_nodes=G.nodes()
+		nodes=_nodes
+		labels=nodes # label each node with itself
+	else:
+		nodes=labels.keys()
+		labels=labels.values()
+	# convert the labels and gather their positions ahead of the text loop
+	# str() will cause "1" and 1 to be labeled the same
+	labels=[l if isinstance(l, basestring) else str(l) for l in labels]
+	if _pos_arr is None:
+		xy=_pos_array(pos, nodes)
+	else:
+		xy=_pos_arr[_node_rows(_node_idx, nodes)]
+
+	# all labels share one font, so set it up once instead of having
+	# every ax.text call build it from size, family and weight; going
+	# through ax.text keeps the labels in ax.texts
+	font=FontProperties(family=font_family,
+						weight=font_weight,
+						size=font_size)
+	text=ax.text
+	transData=ax.transData
 
 	text_items={}  # there is no text collection so we'll fake one        
-	for (n,label) in labels.items():
-		(x,y)=pos[n]
-		if not cb.is_string_like(label):
-			label=str(label) # this will cause "1" and 1 to be labeled the same
-		t=ax.text(x, y,
-				label,
-				size=font_size,
-				color=font_color,
-				family=font_family,
-				weight=font_weight,
-				horizontalalignment='center',
-				verticalalignment='center',
-				transform = ax.transData,
-				)
+	for (n,label,(x,y)) in zip(nodes,labels,xy):
+		t=text(x, y,
+			   label,
+			   color=font_color,
+			   fontproperties=font,
+			   horizontalalignment='center',
+			   verticalalignment='center',
+			   transform = transData,
+			   )
 		text_items[n]=t
 
 	return text_items
 
+def _draw_layout(G, layout_fn, layout_kwds=None, **kwargs):
+	"""Draw G at the positions computed by layout_fn(G, **layout_kwds).
+
+	The layout is handed to draw() as a position array, so no pos
+	dictionary is built and converted back again.  Returns the
+	NetworkArtists from draw().
+	"""
+	if layout_kwds is None:
+		layout_kwds={}
+	nodes, pos_arr = _positions_from_layout(G, layout_fn, **layout_kwds)
+	return draw(G, None, _pos_arr=pos_arr, _node_idx=_node_index(nodes),
+				**kwargs)
+
 def draw_circular(G, **kwargs):
 	"""Draw the graph G with a circular layout"""
 	from networkx.drawing.layout import circular_layout
-	draw(G,circular_layout(G),**kwargs)
+	return _draw_layout(G,circular_layout,**kwargs)
 	
 def draw_random(G, **kwargs):
 	"""Draw the graph G with a random layout."""
 	from networkx.drawing.layout import random_layout
-	draw(G,random_layout(G),**kwargs)
+	return _draw_layout(G,random_layout,**kwargs)
 
 def draw_spectral(G, **kwargs):
 	"""Draw the graph G with a spectral layout."""
 	from networkx.drawing.layout import spectral_layout
-	draw(G,spectral_layout(G),**kwargs)
+	return _draw_layout(G,spectral_layout,**kwargs)
 
 def draw_spring(G, **kwargs):
 	"""Draw the graph G with a spring layout"""
 	from networkx.drawing.layout import spring_layout
-	draw(G,spring_layout(G),**kwargs)
+	return _draw_layout(G,spring_layout,**kwargs)
 
 def draw_shell(G, **kwargs):
 	"""Draw networkx graph with shell layout"""
@@ -394,16 +715,16 @@ def draw_shell(G, **kwargs):
 	nlist = kwargs.get('nlist', None)
 	if nlist != None:        
 		del(kwargs['nlist'])
-	draw(G,shell_layout(G,nlist=nlist),**kwargs)
+	return _draw_layout(G,shell_layout,layout_kwds={'nlist':nlist},**kwargs)
 
 def draw_graphviz(G, prog="neato", **kwargs):
 	"""Draw networkx graph with graphviz layout"""
-	pos=networkx.drawing.graphviz_layout(G,prog)
-	draw(G,pos,**kwargs)
+	return _draw_layout(G,networkx.drawing.graphviz_layout,
+						layout_kwds={'prog':prog},**kwargs)
 
 def draw_nx(G,pos,**kwds):
 	"""For backward compatibility; use draw or draw_networkx"""
-	draw(G,pos,**kwds)
+	return draw(G,pos,**kwds)
 
 #def _test_suite():
 #    import doctest
@@ -416,8 +737,8 @@ if __name__ == "__main__":
 	import sys
 	import unittest
 
-	if sys.version_info[:2] < (2, 4):
-		print "Python version 2.4 or later required (%d.%d detected)." \
+	if sys.version_info[:2] < (2, 6):
+		print "Python version 2.6 or later required (%d.%d detected)." \
 			  %  sys.version_info[:2]
 		sys.exit(-1)
 	# directory of networkx package (relative to this)